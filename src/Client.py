@@ -1,10 +1,3 @@
-import os
-import logging
-import asyncio
-from telethon import TelegramClient, events, Button
-from src.Config import ConfigManager, API_ID, API_HASH, PORTS, ADMIN_ID
-from src.Config import API_ID, API_HASH, CHANNEL_ID, ADMIN_ID ,CLIENTS_JSON_PATH, RATE_LIMIT_SLEEP, GROUPS_BATCH_SIZE, GROUPS_UPDATE_SLEEP
-
 import os
 import logging
 import asyncio
@@ -13,7 +6,10 @@ from datetime import datetime
 from telethon import TelegramClient, events, Button
 from telethon.errors import SessionPasswordNeededError, FloodWaitError
 from telethon.tl.types import Channel, Chat
+from src.Config import ConfigManager, API_ID, API_HASH, PORTS, CHANNEL_ID, ADMIN_ID, CLIENTS_JSON_PATH, RATE_LIMIT_SLEEP, GROUPS_BATCH_SIZE, BULK_CONCURRENCY, STARTUP_CONCURRENCY, STARTUP_CONNECT_INTERVAL
 from src.Keyboards import Keyboard
+from src.Utils import get_session_name, contains_keyword
+from src.Conversation import ConversationState
 
 
 # Set up logger for the SessionManager class
@@ -31,6 +27,8 @@ class SessionManager:
             self.config = config
             self.active_clients = active_clients
             self.tbot = tbot
+            # Sessions found unauthorized or revoked; kept out of the pool until re-added or re-enabled
+            self.unauthorized_sessions = set()
             # Use ConfigManager to manage client configurations
             self.config_manager = ConfigManager("clients.json", self.config)
             logger.info("SessionManager initialized successfully.")
@@ -41,7 +39,8 @@ class SessionManager:
     def detect_sessions(self):
         """
         Detect and load Telegram client sessions from the configuration.
-        Adds sessions to `active_clients` if they are not already active.
+        Adds sessions to `active_clients` if they are not already active
+        and have not been found unauthorized.
         """
         try:
             if not isinstance(self.config.get('clients', {}), dict):
@@ -49,9 +48,10 @@ class SessionManager:
                 self.config['clients'] = {}
 
             for session_name in list(self.config['clients']):
-                if session_name not in self.active_clients:
+                if session_name not in self.active_clients and session_name not in self.unauthorized_sessions:
                     # Initialize Telegram client for the session with the configured port
                     client = TelegramClient(session_name, API_ID, API_HASH)
+                    client._cached_session_name = session_name
                     self.active_clients[session_name] = client
             logger.info("Sessions detected and loaded successfully.")
         except Exception as e:
@@ -66,24 +66,44 @@ class SessionManager:
             # Load session information into active_clients
             self.detect_sessions()
 
-            for session_name, client in list(self.active_clients.items()):
-                try:
-                    # Connect client if not already connected
-                    if not client.is_connected():
-                        await client.connect()
-
-                    # Check if the client is authorized
-                    if await client.is_user_authorized():
-                        logger.info(f"Started client: {session_name}")
-                    else:
-                        logger.warning(f"Client {session_name} is not authorized. Disconnecting...")
-                        await client.disconnect()
-                        await self.notify_admin_unauthorized(session_name)
-
-                    # Sleep to avoid hitting Telegram flood limits
-                    await asyncio.sleep(3)
-                except Exception as e:
-                    logger.error(f"Error starting client {session_name}: {e}")
+            # Start clients concurrently, at most STARTUP_CONCURRENCY at a time, with connects
+            # beginning at least STARTUP_CONNECT_INTERVAL apart to avoid hitting Telegram flood limits
+            semaphore = asyncio.Semaphore(STARTUP_CONCURRENCY)
+            loop = asyncio.get_running_loop()
+            next_connect = loop.time()
+
+            async def wait_connect_turn():
+                nonlocal next_connect
+                now = loop.time()
+                start = max(now, next_connect)
+                next_connect = start + STARTUP_CONNECT_INTERVAL
+                await asyncio.sleep(start - now)
+
+            async def start_client(session_name, client):
+                await wait_connect_turn()
+                async with semaphore:
+                    try:
+                        # Connect client if not already connected
+                        if not client.is_connected():
+                            await client.connect()
+
+                        # Check if the client is authorized
+                        if await client.is_user_authorized():
+                            logger.info(f"Started client: {session_name}")
+                        else:
+                            logger.warning(f"Client {session_name} is not authorized. Disconnecting...")
+                            await client.disconnect()
+                            # Keep only live, authorized connections in the pool used by bulk operations
+                            self.active_clients.pop(session_name, None)
+                            self.unauthorized_sessions.add(session_name)
+                            await self.notify_admin_unauthorized(session_name)
+                    except Exception as e:
+                        logger.error(f"Error starting client {session_name}: {e}")
+
+            await asyncio.gather(*(
+                start_client(session_name, client)
+                for session_name, client in list(self.active_clients.items())
+            ))
         except Exception as e:
             logger.error(f"Error in start_saved_clients: {e}")
 
@@ -92,13 +112,19 @@ class SessionManager:
         Disconnect all active Telegram clients and clear the active client list.
         """
         try:
-            for session_name, client in list(self.active_clients.items()):
+            async def disconnect(session_name, client):
                 try:
                     await client.disconnect()
                     logger.info(f"Client {session_name} disconnected successfully.")
                 except Exception as e:
                     logger.error(f"Error disconnecting client {session_name}: {e}")
-            
+
+            # Disconnect all clients concurrently; each logs its own failure
+            await asyncio.gather(*(
+                disconnect(session_name, client)
+                for session_name, client in list(self.active_clients.items())
+            ))
+
             # Clear the active_clients dictionary
             self.active_clients.clear()
             logger.info("All clients disconnected successfully.")
@@ -115,7 +141,7 @@ class SessionManager:
                 [Button.inline("Delete", f"delete_{session_name}"), Button.inline("Ignore", f"ignore_{session_name}")]
             ]
             await self.tbot.send_message(
-                int(ADMIN_ID),
+                ADMIN_ID,
                 f"Session {session_name} is not authorized. What would you like to do?",
                 buttons=buttons
             )
@@ -129,6 +155,7 @@ class SessionManager:
         :param session_name: The name of the session to delete.
         """
         try:
+            self.unauthorized_sessions.discard(session_name)
             if session_name in self.active_clients:
                 client = self.active_clients[session_name]
                 await client.disconnect()
@@ -146,13 +173,13 @@ class SessionManager:
                 else:
                     logger.warning(f"Session file {session_file} not found.")
 
-                await self.tbot.send_message(int(ADMIN_ID), f"Session {session_name} deleted successfully.")
+                await self.tbot.send_message(ADMIN_ID, f"Session {session_name} deleted successfully.")
             else:
                 logger.warning(f"Session {session_name} not found in configuration.")
-                await self.tbot.send_message(int(ADMIN_ID), f"Session {session_name} not found.")
+                await self.tbot.send_message(ADMIN_ID, f"Session {session_name} not found.")
         except Exception as e:
             logger.error(f"Error deleting session {session_name}: {e}")
-            await self.tbot.send_message(int(ADMIN_ID), f"Error deleting session {session_name}.")
+            await self.tbot.send_message(ADMIN_ID, f"Error deleting session {session_name}.")
 
 
 class AccountHandler:
@@ -184,7 +211,7 @@ class AccountHandler:
         try:
             buttons = [Button.inline("Cancel", b'cancel')]
             await self.tbot.tbot.send_message(chat_id, "Please enter your phone number:", buttons=buttons)
-            self.tbot._conversations[chat_id] = 'phone_number_handler'
+            self.tbot._conversations[chat_id] = ConversationState('phone_number_handler')
         except Exception as e:
             logger.error(f"Error in add_account: {e}")
             await self.tbot.tbot.send_message(chat_id, "Error occurred while adding account. Please try again.")
@@ -199,6 +226,8 @@ class AccountHandler:
         logger.info("phone_number_handler in AccountHandler")
         chat_id = event.chat_id
         phone_number = event.message.text.strip()
+        # Held across the awaits below so the update lands on this conversation, not a newer one
+        state = self.tbot._conversations.get(chat_id)
         try:
             client = TelegramClient(phone_number, API_ID, API_HASH)
             await client.connect()
@@ -207,16 +236,16 @@ class AccountHandler:
                 await self.tbot.tbot.send_message(chat_id, "Authorizing...")
                 await client.send_code_request(phone_number)
                 await self.tbot.tbot.send_message(chat_id, "Enter the verification code:")
-                self.tbot._conversations[chat_id] = 'code_handler'
-                self.tbot.handlers['temp_client'] = client
-                self.tbot.handlers['temp_phone'] = phone_number
+                state.next_handler = 'code_handler'
+                state.client = client
+                state.phone = phone_number
             else:
                 await self.finalize_client_setup(client, phone_number, chat_id)
 
         except Exception as e:
             logger.error(f"Error in phone_number_handler: {e}")
             await self.tbot.tbot.send_message(chat_id, "Error occurred. Please try again.")
-            self.cleanup_temp_handlers()
+            self.cleanup_temp_handlers(chat_id)
 
     async def code_handler(self, event):
         """
@@ -228,18 +257,18 @@ class AccountHandler:
         logger.info("code_handler in AccountHandler")
         chat_id = event.chat_id
         code = event.message.text.strip()
-        client = self.tbot.handlers.get('temp_client')
-        phone_number = self.tbot.handlers.get('temp_phone')
         try:
+            state = self.tbot._conversations[chat_id]
+            client, phone_number = state.client, state.phone
             await client.sign_in(phone_number, code)
             await self.finalize_client_setup(client, phone_number, chat_id)
         except SessionPasswordNeededError:
             await self.tbot.tbot.send_message(chat_id, "Enter your 2FA password:")
-            self.tbot._conversations[chat_id] = 'password_handler'
+            state.next_handler = 'password_handler'
         except Exception as e:
             logger.error(f"Error in code_handler: {e}")
             await self.tbot.tbot.send_message(chat_id, "Error occurred. Please try again.")
-            self.cleanup_temp_handlers()
+            self.cleanup_temp_handlers(chat_id)
 
     async def password_handler(self, event):
         """
@@ -251,15 +280,15 @@ class AccountHandler:
         logger.info("password_handler in AccountHandler")
         chat_id = event.chat_id
         password = event.message.text.strip()
-        client = self.tbot.handlers.get('temp_client')
-        phone_number = self.tbot.handlers.get('temp_phone')
         try:
+            state = self.tbot._conversations[chat_id]
+            client, phone_number = state.client, state.phone
             await client.sign_in(password=password)
             await self.finalize_client_setup(client, phone_number, chat_id)
         except Exception as e:
             logger.error(f"Error in password_handler: {e}")
             await self.tbot.tbot.send_message(chat_id, "Error occurred. Please try again.")
-            self.cleanup_temp_handlers()
+            self.cleanup_temp_handlers(chat_id)
 
     async def finalize_client_setup(self, client, phone_number, chat_id):
         """
@@ -282,25 +311,32 @@ class AccountHandler:
             self.tbot.config['clients'][session_name] = []
             self.tbot.config_manager.save_config(self.tbot.config)
 
+            client._cached_session_name = session_name
+            self.SessionManager.unauthorized_sessions.discard(session_name)
             self.tbot.active_clients[session_name] = client
             client.add_event_handler(self.process_message, events.NewMessage())
 
             await self.tbot.tbot.send_message(chat_id, f"Account {phone_number} added successfully!")
-            self.cleanup_temp_handlers()
+            self.cleanup_temp_handlers(chat_id)
 
         except Exception as e:
             logger.error(f"Error in finalize_client_setup: {e}")
             await self.tbot.tbot.send_message(chat_id, "Error occurred while finalizing setup.")
-            self.cleanup_temp_handlers()
+            self.cleanup_temp_handlers(chat_id)
 
-    def cleanup_temp_handlers(self):
+    def cleanup_temp_handlers(self, chat_id):
         """
-        Removes temporary handlers and data after setup completion.
+        Removes temporary client data from the chat's conversation after setup completion.
+
+        Args:
+            chat_id: Chat ID whose conversation holds the temporary data
         """
         logger.info("cleanup_temp_handlers in AccountHandler")
         try:
-            self.tbot.handlers.pop('temp_client', None)
-            self.tbot.handlers.pop('temp_phone', None)
+            state = self.tbot._conversations.get(chat_id)
+            if state:
+                state.client = None
+                state.phone = None
         except Exception as e:
             logger.error(f"Error in cleanup_temp_handlers: {e}")
 
@@ -336,42 +372,58 @@ class AccountHandler:
                 except json.JSONDecodeError as e:
                     logger.error("Error decoding clients.json.", exc_info=True)
 
-            for session_name, client in self.tbot.active_clients.items():
-                try:
-                    logger.info(f"Processing client: {session_name}")
-                    group_ids = set()
-
-                    async for dialog in client.iter_dialogs(limit=None):
-                        try:
-                            if isinstance(dialog.entity, (Chat, Channel)) and not (
-                                isinstance(dialog.entity, Channel) and dialog.entity.broadcast
-                            ):
-                                group_ids.add(dialog.entity.id)
-
-                            if len(group_ids) % GROUPS_BATCH_SIZE == 0:
-                                await asyncio.sleep(RATE_LIMIT_SLEEP)
-
-                        except Exception as e:
-                            logger.error(f"Error processing dialog for client {session_name}.", exc_info=True)
-                            continue
-
-                        if len(group_ids) % 20 == 0:
-                            await status_message.edit(f"Found {len(group_ids)} groups for {session_name}...")
-
-                    groups_per_client[session_name] = list(group_ids)
-                    logger.info(f"Found {len(group_ids)} groups for client {session_name}.")
-                    await status_message.edit(f"Found {len(group_ids)} groups for {session_name}.")
-                    await asyncio.sleep(GROUPS_UPDATE_SLEEP)
-
-                except FloodWaitError as e:
-                    wait_time = e.seconds
-                    logger.warning(f"FloodWaitError: Sleeping for {wait_time} seconds for client {session_name}.")
-                    await status_message.edit(f"Rate limited. Waiting for {wait_time} seconds...")
-                    await asyncio.sleep(wait_time)
-                    continue
-                except Exception as e:
-                    logger.error(f"Unexpected error while processing client {session_name}.", exc_info=True)
-                    continue
+            # Each account has its own rate limits, so accounts are scanned concurrently (bounded)
+            semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+            async def collect_groups(session_name, client):
+                async with semaphore:
+                    try:
+                        logger.info(f"Processing client: {session_name}")
+                        group_ids = set()
+
+                        async for dialog in client.iter_dialogs(limit=None):
+                            try:
+                                if isinstance(dialog.entity, (Chat, Channel)) and not (
+                                    isinstance(dialog.entity, Channel) and dialog.entity.broadcast
+                                ):
+                                    group_ids.add(dialog.entity.id)
+
+                                if len(group_ids) % GROUPS_BATCH_SIZE == 0:
+                                    await asyncio.sleep(RATE_LIMIT_SLEEP)
+
+                            except Exception as e:
+                                logger.error(f"Error processing dialog for client {session_name}.", exc_info=True)
+                                continue
+
+                        groups_per_client[session_name] = list(group_ids)
+                        logger.info(f"Found {len(group_ids)} groups for client {session_name}.")
+
+                    except FloodWaitError as e:
+                        # Waiting here would hold the slot and delay saving every other account's groups
+                        logger.warning(f"FloodWaitError: Skipping client {session_name}, rate limited for {e.seconds} seconds.")
+                    except Exception as e:
+                        logger.error(f"Unexpected error while processing client {session_name}.", exc_info=True)
+
+            # Progress is reported from here rather than from each scan, so concurrent scans don't
+            # overwrite each other's text and a failed edit can't discard an account's results
+            clients = list(self.tbot.active_clients.items())
+            done = 0
+            last_edit = 0
+            for completed in asyncio.as_completed([
+                collect_groups(session_name, client) for session_name, client in clients
+            ]):
+                await completed
+                done += 1
+                now = asyncio.get_running_loop().time()
+                if done == len(clients) or now - last_edit >= 2:
+                    last_edit = now
+                    found = sum(len(group_ids) for group_ids in groups_per_client.values())
+                    try:
+                        await status_message.edit(
+                            f"Scanned {done}/{len(clients)} accounts, found {found} groups so far..."
+                        )
+                    except Exception as e:
+                        logger.warning(f"Error updating group scan progress: {e}")
 
             for session_name, group_ids in groups_per_client.items():
                 if session_name in json_data["clients"]:
@@ -429,7 +481,7 @@ class AccountHandler:
                     logger.info(f"Message from ignored user {sender.id}. Skipping.")
                     return
 
-                if not any(keyword.lower() in message.lower() for keyword in self.tbot.config['KEYWORDS']):
+                if not contains_keyword(message, self.tbot.config['KEYWORDS']):
                     logger.debug("Message does not contain any configured keywords. Skipping.")
                     return
 
@@ -437,7 +489,7 @@ class AccountHandler:
                 chat_title = getattr(chat, 'title', 'Unknown Chat')
                 logger.info(f"Processing message from chat: {chat_title}")
 
-                account_name = client.session.filename.replace('.session', '')
+                account_name = get_session_name(client)
 
                 text = (
                     f"Account: {account_name}\n"
@@ -446,7 +498,7 @@ class AccountHandler:
                     f"• Message:\n{message}\n"
                 )
 
-                if hasattr(chat, 'username') and chat.username:
+                if getattr(chat, 'username', None):
                     message_link = f"https://t.me/{chat.username}/{event.id}"
                 else:
                     chat_id = str(event.chat_id).replace('-100', '', 1)
@@ -545,6 +597,8 @@ class AccountHandler:
                 logger.info(f"Enabling client: {session}")
                 client = TelegramClient(session, API_ID, API_HASH)
                 await client.start()
+                client._cached_session_name = session
+                self.SessionManager.unauthorized_sessions.discard(session)
                 self.tbot.active_clients[session] = client
                 logger.info(f"Client {session} enabled successfully.")
                 await event.respond(f"Account {session} enabled.")
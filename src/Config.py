@@ -141,6 +141,14 @@ CLIENTS_JSON_PATH = str(get_env_variable('CLIENTS_JSON_PATH', default='clients.j
 RATE_LIMIT_SLEEP = int(get_env_variable('RATE_LIMIT_SLEEP', default=60))
 GROUPS_BATCH_SIZE = int(get_env_variable('GROUPS_BATCH_SIZE', default=10))
 GROUPS_UPDATE_SLEEP = int(get_env_variable('GROUPS_UPDATE_SLEEP', default=60))
+BULK_CONCURRENCY = int(get_env_variable('BULK_CONCURRENCY', default=16))
+BULK_BATCH_SIZE = int(get_env_variable('BULK_BATCH_SIZE', default=32))
+BULK_BATCH_DELAY = float(get_env_variable('BULK_BATCH_DELAY', default=0.25))
+BULK_FLOOD_WAIT_MAX = int(get_env_variable('BULK_FLOOD_WAIT_MAX', default=30))
+BULK_RATE_LIMIT = float(get_env_variable('BULK_RATE_LIMIT', default=25))
+BULK_RATE_BURST = int(get_env_variable('BULK_RATE_BURST', default=30))
+STARTUP_CONCURRENCY = int(get_env_variable('STARTUP_CONCURRENCY', default=4))
+STARTUP_CONNECT_INTERVAL = float(get_env_variable('STARTUP_CONNECT_INTERVAL', default=1))
 
 # Load port configurations from environment variables
 PORTS = {
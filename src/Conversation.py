@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass(slots=True)
+class ConversationState:
+    """
+    Per-chat conversation step and the values collected along the way.
+    Stored in `TelegramBot._conversations` keyed by chat ID, so chats never share values.
+    """
+    next_handler: str
+    # Account setup
+    client: Optional[Any] = None
+    phone: Optional[str] = None
+    # Reaction flow
+    chat: Optional[Any] = None
+    message_id: Optional[int] = None
+    reaction: Optional[str] = None
@@ -9,6 +9,7 @@ from telethon.tl.types import Channel, Chat
 from src.Config import API_ID, API_HASH, CHANNEL_ID, ADMIN_ID ,CLIENTS_JSON_PATH, RATE_LIMIT_SLEEP, GROUPS_BATCH_SIZE, GROUPS_UPDATE_SLEEP
 from src.Client import SessionManager ,AccountHandler
 from src.Keyboards import Keyboard 
+from src.Conversation import ConversationState
 
 # Setting up the logger
 logging.basicConfig(level=logging.INFO)
@@ -26,7 +27,7 @@ class CommandHandler:
         """Handle /start command"""
         logger.info("start command in CommandHandler")
         try:
-            if event.sender_id != int(ADMIN_ID):
+            if event.sender_id != ADMIN_ID:
                 await event.respond("You are not the admin")
                 return
 
@@ -51,7 +52,7 @@ class KeywordHandler:
             if isinstance(event, events.CallbackQuery.Event):
                 buttons = [Button.inline("Cancel", b'cancel')]
                 await event.respond("Please enter the keyword you want to add.", buttons=buttons)
-                self.tbot._conversations[event.chat_id] = 'add_keyword_handler'
+                self.tbot._conversations[event.chat_id] = ConversationState('add_keyword_handler')
                 return
 
             keyword = str(event.message.text.strip())
@@ -76,7 +77,7 @@ class KeywordHandler:
             if isinstance(event, events.CallbackQuery.Event):
                 buttons = [Button.inline("Cancel", b'cancel')]
                 await event.respond("Please enter the keyword you want to remove.", buttons=buttons)
-                self.tbot._conversations[event.chat_id] = 'remove_keyword_handler'
+                self.tbot._conversations[event.chat_id] = ConversationState('remove_keyword_handler')
                 return
 
             keyword = str(event.message.text.strip())
@@ -101,7 +102,7 @@ class KeywordHandler:
             if isinstance(event, events.CallbackQuery.Event):
                 buttons = [Button.inline("Cancel", b'cancel')]
                 await event.respond("Please enter the user ID you want to ignore.", buttons=buttons)
-                self.tbot._conversations[event.chat_id] = 'ignore_user_handler'
+                self.tbot._conversations[event.chat_id] = ConversationState('ignore_user_handler')
                 return
 
             user_id = int(event.message.text.strip())
@@ -126,7 +127,7 @@ class KeywordHandler:
             if isinstance(event, events.CallbackQuery.Event):
                 buttons = [Button.inline("Cancel", b'cancel')]
                 await event.respond("Please enter the user ID you want to stop ignoring.", buttons=buttons)
-                self.tbot._conversations[event.chat_id] = 'delete_ignore_user_handler'
+                self.tbot._conversations[event.chat_id] = ConversationState('delete_ignore_user_handler')
                 return
 
             user_id = int(event.message.text.strip())
@@ -169,12 +170,13 @@ class MessageHandler:
         """Handle incoming messages based on conversation state"""
         logger.info("message_handler in MessageHandler")
 
-        if event.sender_id != int(ADMIN_ID):
+        if event.sender_id != ADMIN_ID:
             await event.respond("You are not the admin")
             return
 
-        if event.chat_id in self.tbot._conversations:
-            handler_name = self.tbot._conversations[event.chat_id]
+        state = self.tbot._conversations.get(event.chat_id)
+        if state:
+            handler_name = state.next_handler
             if handler_name == 'phone_number_handler':
                 await self.account_handler.phone_number_handler(event)
                 return True
@@ -277,7 +279,7 @@ class CallbackHandler:
         """Handle callback queries"""
         logger.info("callback_handler in CallbackHandler")
         try:
-            if event.sender_id != int(ADMIN_ID):
+            if event.sender_id != ADMIN_ID:
                 await event.respond("You are not the admin")
                 return
 
@@ -293,7 +295,7 @@ class CallbackHandler:
             if data == 'request_phone_number':
                 logger.info("request_phone_number in callback_handler")
                 await event.respond("Please enter your phone number:")
-                self.tbot._conversations[event.chat_id] = 'phone_number_handler'
+                self.tbot._conversations[event.chat_id] = ConversationState('phone_number_handler')
             elif data.startswith('ignore_'):
                 parts = data.split('_')
                 if len(parts) == 2 and parts[1].isdigit():
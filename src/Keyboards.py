@@ -1,16 +1,6 @@
-from telethon import Button
 import logging
-
+from telethon import Button
 from src.actions import Actions
-import os
-import logging
-import asyncio
-import json
-from datetime import datetime
-from telethon import TelegramClient, events, Button
-from telethon.errors import SessionPasswordNeededError, FloodWaitError
-from telethon.tl.types import Channel, Chat
-from src.Config import API_ID, API_HASH, CHANNEL_ID, ADMIN_ID
 
 logger = logging.getLogger(__name__)
 
@@ -2,6 +2,7 @@ import logging
 from telethon import TelegramClient, events, Button
 from src.Config import CHANNEL_ID
 from src.Handlers import Keyboard
+from src.Utils import get_session_name, contains_keyword
 
 # Set up logger for the Monitor class
 logger = logging.getLogger(__name__)
@@ -79,7 +80,7 @@ class Monitor:
                     return
 
                 # Check if the message contains any of the configured keywords
-                if not any(keyword.lower() in message.lower() for keyword in self.tbot.config['KEYWORDS']):
+                if not contains_keyword(message, self.tbot.config['KEYWORDS']):
                     logger.debug("Message does not contain any configured keywords. Skipping.")
                     return
 
@@ -88,8 +89,8 @@ class Monitor:
                 chat_title = getattr(chat, 'title', '-') or '-'
                 logger.info(f"Processing message from chat: {chat_title}")
 
-                # Extract session name from the client's session file
-                account_name = client.session.filename.replace('.session', '')
+                # Session name cached on the client when it was registered
+                account_name = get_session_name(client)
 
                 # Prepare the message content for forwarding
                 text = (
@@ -100,7 +101,7 @@ class Monitor:
                 )
 
                 # Generate a link to the original message
-                if hasattr(chat, 'username') and chat.username:
+                if getattr(chat, 'username', None):
                     message_link = f"https://t.me/{chat.username}/{event.id}"
                 else:
                     chat_id = str(event.chat_id).replace('-100', '', 1).replace('-', '')
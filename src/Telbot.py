@@ -22,7 +22,9 @@ class TelegramBot:
             self.config = self.config_manager.load_config()
             self.tbot = TelegramClient('bot2', API_ID, API_HASH)
             self.active_clients = {}
-            self.handlers = {}
+            # chat_id -> ConversationState. Single set/pop calls are atomic on the event loop, so
+            # there is no lock; a handler that awaits between reading its state and updating or
+            # clearing it must act on the object it read and only pop it if it is still current.
             self._conversations = {}
             self.client_manager = SessionManager(self.config, self.active_clients, self.tbot)
             self.account_handler = AccountHandler(self)
@@ -67,7 +69,7 @@ class TelegramBot:
         :param handler: The handler function to wrap.
         """
         async def wrapper(event):
-            if event.sender_id == int(ADMIN_ID):
+            if event.sender_id == ADMIN_ID:
                 await handler(event)
             else:
                 await event.respond("You are not the admin")
@@ -84,7 +86,7 @@ class TelegramBot:
             # Start monitoring messages for all active clients (only once per client)
             tasks = []
             for client in self.active_clients.values():
-                if not hasattr(client, '_message_processing_set'):
+                if not getattr(client, '_message_processing_set', False):
                     tasks.append(self.monitor.process_messages_for_client(client))
                     client._message_processing_set = True
 
@@ -104,8 +106,7 @@ class TelegramBot:
         :param message: The message text to send.
         """
         try:
-            admin_id = int(ADMIN_ID)  # Ensure ADMIN_ID is an integer
-            await self.tbot.send_message(admin_id, message)
+            await self.tbot.send_message(ADMIN_ID, message)
             logger.info("Notification sent to admin.")
         except Exception as e:
             logger.error(f"Error sending notification to admin: {e}")
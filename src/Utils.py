@@ -0,0 +1,46 @@
+import os
+import re
+import functools
+
+
+def get_session_name(client):
+    """
+    Return the session name of a Telegram client (its key in `active_clients`).
+    The name is cached on the client, either at registration or on the first call.
+    :param client: TelegramClient instance.
+    :return: Session name, or 'Unknown' if the client has no session file.
+    """
+    name = getattr(client, '_cached_session_name', None)
+    if name is not None:
+        return name
+    filename = getattr(getattr(client, 'session', None), 'filename', None)
+    if not filename:
+        return 'Unknown'
+    name = os.path.basename(filename).replace('.session', '')
+    try:
+        client._cached_session_name = name
+    except AttributeError:
+        pass
+    return name
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_keywords(keywords):
+    """
+    Compile a tuple of keywords into one case-insensitive alternation.
+    Cached, so the pattern is only rebuilt when the keyword list changes.
+    """
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+def contains_keyword(text, keywords):
+    """
+    Check whether `text` contains any of the keywords, ignoring case.
+    :param text: Message text to scan.
+    :param keywords: Iterable of keywords, e.g. config['KEYWORDS'].
+    :return: True if at least one keyword occurs in the text.
+    """
+    keywords = tuple(keywords)
+    if not keywords:
+        return False
+    return _compile_keywords(keywords).search(text) is not None
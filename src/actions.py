@@ -1,14 +1,343 @@
 import logging
 import random
+import functools
+import hashlib
+import time
+import re
 import asyncio
+from collections import OrderedDict
+from itertools import islice, accumulate
 from telethon import TelegramClient, events, Button
-from src.Config import CHANNEL_ID
+from telethon.errors import AuthKeyUnregisteredError, SessionRevokedError, FloodWaitError
+from telethon.tl.functions.messages import SendReactionRequest
+from telethon.tl.types import ReactionEmoji
+from src.Config import CHANNEL_ID, BULK_CONCURRENCY, BULK_BATCH_SIZE, BULK_BATCH_DELAY, BULK_FLOOD_WAIT_MAX, BULK_RATE_LIMIT, BULK_RATE_BURST
+from src.Utils import get_session_name
+from src.Conversation import ConversationState
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between edits of a bulk progress message
+PROGRESS_EDIT_INTERVAL = 2
+
+# Upper bound in seconds of the random gap between the starts of consecutive reacting accounts
+REACTION_MAX_DELAY = 10
+
+# Actions that only open a conversation with the admin rather than doing per-account work
+_CONVERSATION_ACTIONS = frozenset({'reaction'})
+
+# Errors meaning the account's session is no longer usable
+_REVOKED_ERRORS = (AuthKeyUnregisteredError, SessionRevokedError)
+
+# Maximum number of (account, peer) entries kept in the resolved-entity cache
+ENTITY_CACHE_SIZE = 1024
+
+# Seconds a cached entity stays valid before it is resolved again
+ENTITY_CACHE_TTL = 300
+
+# Callback suffix -> emoticon accepted by Telegram for each reaction button
+_REACTION_EMOJIS = {
+    'thumbsup': '👍',
+    'heart': '❤',
+    'laugh': '😂',
+    'wow': '😮',
+    'sad': '😢',
+    'angry': '😡',
+}
+
+# SendReactionRequest only reads the reaction list, so one instance per emoticon is shared
+_REACTION_OBJS = {emoji: [ReactionEmoji(emoticon=emoji)] for emoji in _REACTION_EMOJIS.values()}
+
+# Raw callback data of the picker buttons -> emoji, so callbacks are matched without decoding
+_REACTION_CALLBACKS = {f'reaction_{name}'.encode(): emoji for name, emoji in _REACTION_EMOJIS.items()}
+
+# Reaction picker shown for every link; the buttons never change, so they are built once
+_REACTION_KEYBOARD = [
+    [
+        Button.inline("👍", b'reaction_thumbsup'),
+        Button.inline("❤️", b'reaction_heart'),
+        Button.inline("😂", b'reaction_laugh'),
+    ],
+    [
+        Button.inline("😮", b'reaction_wow'),
+        Button.inline("😢", b'reaction_sad'),
+        Button.inline("😡", b'reaction_angry'),
+    ],
+    [Button.inline("Cancel", b'cancel')],
+]
+
+
+# Message links: t.me/c/<channel id>/<msg id> or t.me/<username>/<msg id>
+_MESSAGE_LINK_RE = re.compile(
+    r'^(?:https?://)?(?:www\.)?(?:t\.me|telegram\.me)/'
+    r'(?:c/(?P<channel_id>\d+)|(?P<username>[A-Za-z][A-Za-z0-9_]{3,31}))'
+    r'/(?P<message_id>\d+)/?(?:[?#].*)?$'
+)
+
+_MESSAGE_LINK_PREFIXES = ('https://', 'http://', 't.me/', 'telegram.me/', 'www.')
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_link_sync(link):
+    """
+    Split a message link into its chat part and message ID without touching the network.
+    Private links (t.me/c/<id>/<msg>) map straight to a channel ID; public links
+    return the username, which still has to be resolved by an account.
+
+    :return: Tuple of (chat, message_id, needs_resolve).
+    """
+    link = link.strip()
+    # Cheap prefix check rejects obvious garbage before the regex engine runs
+    match = link.startswith(_MESSAGE_LINK_PREFIXES) and _MESSAGE_LINK_RE.match(link)
+    if not match:
+        raise ValueError(f"Invalid message link: {link}")
+    message_id = int(match['message_id'])
+    if match['channel_id']:
+        return int(f"-100{match['channel_id']}"), message_id, False
+    return match['username'], message_id, True
+
+
+class _TokenBucket:
+    """
+    Paces callers to `rate` acquisitions per second, allowing bursts of up to `capacity`.
+    Callers that find the bucket empty reserve a future token and sleep until it is due.
+    """
+    __slots__ = ('rate', 'capacity', '_tokens', '_last')
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = None
+
+    async def acquire(self):
+        now = asyncio.get_running_loop().time()
+        if self._last is not None:
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+@functools.lru_cache(maxsize=1024)
+def _session_token(session):
+    """
+    Short callback token for a session name. Derived from the name alone, so buttons stay valid
+    across restarts and pool reordering, and fit Telegram's 64-byte callback data limit.
+    """
+    return hashlib.blake2s(session.encode(), digest_size=6).hexdigest()
+
+
+def _handler_errors(func):
+    """
+    Decorator for conversation step handlers: log unexpected errors, tell the user,
+    and reset the conversation so it doesn't stay parked on a broken step.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, event, *args, **kwargs):
+        state = self.tbot._conversations.get(event.chat_id)
+        try:
+            return await func(self, event, *args, **kwargs)
+        except Exception as e:
+            logger.error(f"Error in {func.__name__}: {e}")
+            # Only reset the step that failed, not a conversation started while it was awaiting
+            self._clear_conversation(event.chat_id, state)
+            await event.respond("Error processing request. Please try again.")
+    return wrapper
+
+
 class Actions:
     def __init__(self, tbot):
         self.tbot = tbot
+        # Caps in-flight per-account requests so bulk runs don't trip FloodWait
+        self._bulk_semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+        # Shared pacing for bulk requests across all accounts; disabled when BULK_RATE_LIMIT is 0
+        self._bulk_rate = _TokenBucket(BULK_RATE_LIMIT, BULK_RATE_BURST) if BULK_RATE_LIMIT > 0 else None
+        # Whitelist of actions that callback data may trigger, bound once
+        self._action_handlers = {
+            'reaction': self.reaction,
+            'poll': self.poll,
+            'join': self.join,
+            'left': self.left,
+            'block': self.block,
+            'send_pv': self.send_pv,
+            'comment': self.comment,
+            'exit': self.exit,
+        }
+        # LRU of (session name, peer) -> (resolved at, input entity).
+        # Input entities are only valid for the account that resolved them.
+        self._entity_cache = OrderedDict()
+        # (session name, peer) -> in-flight resolve task, so concurrent misses share one request
+        self._resolve_inflight = {}
+        # Strong references to fire-and-forget tasks so they aren't garbage collected mid-run
+        self._background_tasks = set()
+
+    def _run_in_background(self, coro):
+        """
+        Schedule `coro` without awaiting it, keeping a reference until it finishes.
+        """
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_done)
+        return task
+
+    def _background_done(self, task):
+        """
+        Release a finished background task and log its failure, since nothing awaits it.
+        """
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background task failed: {task.exception()}")
+
+    def _clear_conversation(self, chat_id, state=None):
+        """
+        Drop the chat's conversation step together with the values collected for it.
+        If `state` is given, only drop it while it is still the chat's current conversation.
+        """
+        if state is None or self.tbot._conversations.get(chat_id) is state:
+            self.tbot._conversations.pop(chat_id, None)
+
+    async def _stream_bulk_operation(self, accounts, operation, max_delay=0):
+        """
+        Run `operation(account)` for all accounts concurrently and yield each result as it finishes.
+        Accounts are dispatched in windows of BULK_BATCH_SIZE with a BULK_BATCH_DELAY pause
+        between windows, so requests reach Telegram in waves instead of one burst.
+        With `max_delay`, account starts are spread like a serial loop sleeping a random 1..max_delay
+        seconds between accounts: start offsets accumulate across the whole run, and each account
+        waits for its offset before taking a slot.
+
+        :yield: Tuple of (account, status, error) where status is 'ok', 'revoked' or 'error'.
+        """
+        async def attempt(account):
+            async with self._bulk_semaphore:
+                if self._bulk_rate:
+                    await self._bulk_rate.acquire()
+                await operation(account)
+
+        async def run(account, delay):
+            if delay:
+                # Staggered start happens outside the slot so waiting accounts don't block working ones
+                await asyncio.sleep(delay)
+            try:
+                try:
+                    await attempt(account)
+                except FloodWaitError as e:
+                    # Telethon already sleeps through waits up to its flood_sleep_threshold, so longer
+                    # waits reach here; retrying those inside a bulk run would just be rejected again
+                    if e.seconds > BULK_FLOOD_WAIT_MAX:
+                        raise
+                    logger.warning(f"FloodWaitError: Sleeping for {e.seconds} seconds for account {get_session_name(account)}.")
+                    # Wait outside the slot so other accounts keep working meanwhile
+                    await asyncio.sleep(e.seconds)
+                    await attempt(account)
+                return account, 'ok', None
+            except _REVOKED_ERRORS as e:
+                logger.warning(f"Session of account {get_session_name(account)} is revoked: {e}")
+                return account, 'revoked', e
+            except Exception as e:
+                logger.error(f"Bulk operation failed for account {get_session_name(account)}: {e}")
+                return account, 'error', e
+
+        # Reconnect dropped clients up front so the per-account operations reuse live connections
+        disconnected = [account for account in accounts if not account.is_connected()]
+        if disconnected:
+            results = await asyncio.gather(*(account.connect() for account in disconnected), return_exceptions=True)
+            for account, result in zip(disconnected, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Error reconnecting account {get_session_name(account)}: {result}")
+
+        total = len(accounts)
+        if total > BULK_CONCURRENCY:
+            logger.info(f"Bulk operation on {total} accounts; {total - BULK_CONCURRENCY} will wait for a free slot.")
+        loop = asyncio.get_running_loop()
+        run_start = loop.time()
+        if max_delay:
+            offsets = list(accumulate(random.randint(1, max_delay) for _ in range(total)))
+        else:
+            offsets = [0] * total
+        for start in range(0, total, BULK_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(BULK_BATCH_DELAY)
+            window = accounts[start:start + BULK_BATCH_SIZE]
+            # Offsets are relative to the start of the run, so later windows only wait what remains
+            now = loop.time()
+            delays = [max(0, run_start + offset - now) for offset in offsets[start:start + BULK_BATCH_SIZE]]
+            tasks = [asyncio.create_task(run(account, delay)) for account, delay in zip(window, delays)]
+            try:
+                for completed in asyncio.as_completed(tasks):
+                    yield await completed
+            finally:
+                # If the consumer is cancelled or stops early, don't leave this window running detached
+                for task in tasks:
+                    task.cancel()
+
+    async def _execute_bulk_operation(self, accounts, operation, progress_msg=None, max_delay=0):
+        """
+        Consume `_stream_bulk_operation` and tally results as they arrive.
+        If `progress_msg` is given it is edited with a running "done/total" count.
+
+        :return: Tuple of (success_count, error_count).
+        """
+        total = len(accounts)
+        step = max(1, total // 10)
+        last_edit = asyncio.get_running_loop().time()
+        revoked_accounts = []
+        success_count = 0
+        error_count = 0
+        async for account, status, _ in self._stream_bulk_operation(accounts, operation, max_delay):
+            if status == 'ok':
+                success_count += 1
+            else:
+                error_count += 1
+                if status == 'revoked':
+                    revoked_accounts.append(account)
+            done = success_count + error_count
+            now = asyncio.get_running_loop().time()
+            # Edit at most every PROGRESS_EDIT_INTERVAL seconds so progress itself isn't flood-limited
+            if progress_msg and done % step == 0 and now - last_edit >= PROGRESS_EDIT_INTERVAL:
+                last_edit = now
+                try:
+                    await progress_msg.edit(f"Progress: {done}/{total} done")
+                except Exception as e:
+                    logger.warning(f"Error updating progress message: {e}")
+        if revoked_accounts:
+            # Cleanup and admin notification shouldn't delay the bulk result
+            self._run_in_background(self._remove_revoked_sessions(revoked_accounts))
+        return success_count, error_count
+
+    async def _remove_revoked_sessions(self, revoked_accounts):
+        """
+        Drop accounts with revoked sessions from the active pool and ask the admin what to do with them.
+        """
+        # Every client is stored under the session name stamped on it, so no scan of the pool is needed.
+        # The identity check skips sessions that were re-added with a new client meanwhile.
+        sessions = [
+            session for session, account in zip(map(get_session_name, revoked_accounts), revoked_accounts)
+            if self.tbot.active_clients.get(session) is account
+        ]
+
+        async def remove(session):
+            try:
+                self._forget_entities(session)
+                client = self.tbot.active_clients.pop(session, None)
+                # Keep detect_sessions from loading the revoked session back into the pool
+                self.tbot.client_manager.unauthorized_sessions.add(session)
+                if client:
+                    await client.disconnect()
+                logger.warning(f"Removed revoked session {session} from active clients.")
+                await self.tbot.client_manager.notify_admin_unauthorized(session)
+            except Exception as e:
+                logger.error(f"Error removing revoked session {session}: {e}")
+
+        await asyncio.gather(*(remove(session) for session in sessions))
+
+    def _forget_entities(self, session):
+        """
+        Drop every cached entity resolved by the given session.
+        """
+        for key in [key for key in self._entity_cache if key[0] == session]:
+            del self._entity_cache[key]
 
     async def prompt_group_action(self, event, action_name):
         """
@@ -17,32 +346,71 @@ class Actions:
         total_accounts = len(self.tbot.active_clients)
         message = f"There are {total_accounts} accounts available. Please choose how many accounts (from 1 to {total_accounts}) will perform the {action_name} action."
         buttons = [Button.inline(str(i), f"{action_name}_{i}") for i in range(1, total_accounts + 1)]
-        await event.respond(message, buttons=buttons)
+        rows = [buttons[i:i + 3] for i in range(0, len(buttons), 3)]
+        await event.respond(message, buttons=rows)
 
     async def prompt_individual_action(self, event, action_name):
         """
         Show a list of account names as clickable buttons and prompt the user to select which account should perform the action.
         """
-        buttons = [Button.inline(session, f"{action_name}_{session}") for session in self.tbot.active_clients.keys()]
-        await event.respond("Please select an account to perform the action:", buttons=buttons)
+        buttons = [
+            Button.inline(session, f"{action_name}_{_session_token(session)}".encode())
+            for session in self.tbot.active_clients.keys()
+        ]
+        rows = [buttons[i:i + 2] for i in range(0, len(buttons), 2)]
+        await event.respond("Please select an account to perform the action:", buttons=rows)
 
     async def handle_group_action(self, event, action_name, num_accounts):
         """
         Handle the group action by calling the respective function for all selected accounts.
         """
-        accounts = list(self.tbot.active_clients.values())[:num_accounts]
-        for account in accounts:
-            await getattr(self, action_name)(account, event)
+        handler = self._action_handlers.get(action_name)
+        if not handler:
+            await event.respond(f"Unknown action {action_name}.")
+            return
+        if action_name in _CONVERSATION_ACTIONS:
+            # The conversation asks for its own account count and runs the bulk step itself
+            await handler(None, event)
+            return
+        total_accounts = len(self.tbot.active_clients)
+        if not 1 <= num_accounts <= total_accounts:
+            await event.respond(f"Please choose between 1 and {total_accounts} accounts.")
+            return
+        progress_msg, success_count, error_count = await self._run_bulk(
+            event, num_accounts, lambda account: handler(account, event)
+        )
+        await progress_msg.edit(
+            f"{action_name.title()} finished on {success_count} accounts. Failed: {error_count}."
+        )
 
-    async def handle_individual_action(self, event, action_name, session):
+    async def _run_bulk(self, event, num_accounts, operation, max_delay=0):
         """
-        Handle the individual action by calling the respective function for the selected account.
+        Run `operation` on the first `num_accounts` active clients and report progress in one message.
+
+        :return: Tuple of (progress_msg, success_count, error_count).
+        """
+        accounts = list(islice(self.tbot.active_clients.values(), num_accounts))
+        progress_msg = await event.respond(f"Progress: 0/{len(accounts)} done")
+        success_count, error_count = await self._execute_bulk_operation(
+            accounts, operation, progress_msg=progress_msg, max_delay=max_delay
+        )
+        return progress_msg, success_count, error_count
+
+    async def handle_individual_action(self, event, action_name, session_id):
         """
-        account = self.tbot.active_clients.get(session)
-        if account:
-            await getattr(self, action_name)(account, event)
-        else:
-            await event.respond(f"Account {session} not found.")
+        Handle the individual action by calling the respective function for the selected account.
+        `session_id` is the session token embedded in the button data by prompt_individual_action.
+        """
+        handler = self._action_handlers.get(action_name)
+        if not handler:
+            await event.respond(f"Unknown action {action_name}.")
+            return
+        # Buttons from older prompts may name accounts that have since been removed
+        session = next((s for s in self.tbot.active_clients if _session_token(s) == session_id), None)
+        if session is None:
+            await event.respond("Account not found. Please pick the account again.")
+            return
+        await handler(self.tbot.active_clients[session], event)
 
     async def reaction(self, account, event):
         """
@@ -50,108 +418,163 @@ class Actions:
         """
         # Step 1: Ask for the link to the message
         await event.respond("Please provide the link to the message where the reaction will be applied.")
-        self.tbot._conversations[event.chat_id] = 'reaction_link_handler'
+        self.tbot._conversations[event.chat_id] = ConversationState('reaction_link_handler')
 
+    @_handler_errors
     async def reaction_link_handler(self, event):
         """
         Handle the link input for the reaction action.
         """
         link = event.message.text.strip()
-        await event.respond("Please select a reaction:", buttons=[
-            Button.inline("👍", b'reaction_thumbsup'),
-            Button.inline("❤️", b'reaction_heart'),
-            Button.inline("😂", b'reaction_laugh'),
-            Button.inline("😮", b'reaction_wow'),
-            Button.inline("😢", b'reaction_sad'),
-            Button.inline("😡", b'reaction_angry')
-        ])
-        self.tbot._conversations[event.chat_id] = 'reaction_select_handler'
-        self.tbot.handlers['reaction_link'] = link
+        try:
+            chat, message_id, _ = _parse_link_sync(link)
+        except ValueError as e:
+            await event.respond(f"Error: {e}. Please send a link like https://t.me/channel/123.")
+            return
+        await event.respond("Please select a reaction:", buttons=_REACTION_KEYBOARD)
+        # Parsed once here so every account in the bulk run reuses it
+        self.tbot._conversations[event.chat_id] = ConversationState(
+            'reaction_select_handler', chat=chat, message_id=message_id
+        )
 
+    @_handler_errors
     async def reaction_select_handler(self, event):
         """
         Handle the reaction selection.
         """
-        reaction = event.data.decode().split('_')[1]
+        # Picker buttons stay clickable in chat history, so make sure this chat is still on this step
+        state = self.tbot._conversations.get(event.chat_id)
+        if state is None or state.next_handler != 'reaction_select_handler':
+            await event.respond("This reaction has expired. Please start a new reaction.")
+            return
+        reaction = _REACTION_CALLBACKS.get(event.data)
+        if reaction is None:
+            await event.respond("Unknown reaction. Please pick one of the buttons.")
+            return
+        state.next_handler = 'reaction_count_handler'
+        state.reaction = reaction
         total_accounts = len(self.tbot.active_clients)
         await event.respond(f"Please specify the number of reactions (from 1 to {total_accounts}):")
-        self.tbot._conversations[event.chat_id] = 'reaction_count_handler'
-        self.tbot.handlers['reaction'] = reaction
 
+    @_handler_errors
     async def reaction_count_handler(self, event):
         """
         Handle the number of reactions input.
         """
+        state = self.tbot._conversations.get(event.chat_id)
+        if state is None or state.next_handler != 'reaction_count_handler':
+            await event.respond("No reaction in progress. Please start a new reaction.")
+            return
+        if state.chat is None or state.message_id is None:
+            self._clear_conversation(event.chat_id, state)
+            await event.respond("The reaction link is missing. Please start a new reaction.")
+            return
         try:
             count = int(event.message.text.strip())
             if count < 1 or count > len(self.tbot.active_clients):
                 raise ValueError("Invalid number of reactions.")
-            link = self.tbot.handlers['reaction_link']
-            reaction = self.tbot.handlers['reaction']
-            accounts = list(self.tbot.active_clients.values())[:count]
-            for account in accounts:
-                await self.apply_reaction(account, link, reaction)
-                await asyncio.sleep(random.randint(1, 10))
-            await event.respond(f"Applied {reaction} reaction using {count} accounts.")
         except ValueError as e:
+            # Keep the conversation on this step so the user can retry
             await event.respond(f"Error: {e}. Please enter a valid number of reactions.")
-            self.tbot._conversations[event.chat_id] = 'reaction_count_handler'
+            return
+
+        # Taken out before the run so a number sent meanwhile can't start a second run,
+        # and the chat is free for other conversations while the reactions go out
+        self._clear_conversation(event.chat_id, state)
+        chat, message_id, reaction = state.chat, state.message_id, state.reaction
+
+        async def reaction_operation(account):
+            await self.apply_reaction(account, chat, message_id, reaction)
+
+        # Random start offsets keep the accounts from hitting Telegram at the same instant
+        progress_msg, success_count, error_count = await self._run_bulk(
+            event, count, reaction_operation, max_delay=REACTION_MAX_DELAY
+        )
+        await progress_msg.edit(
+            f"Applied {reaction} reaction using {success_count} accounts. Failed: {error_count}."
+        )
 
-    async def apply_reaction(self, account, link, reaction):
+    async def _cached_resolve(self, account, peer):
+        """
+        Resolve `peer` to an input entity for `account`, reusing earlier lookups.
+        """
+        key = (get_session_name(account), peer)
+        cached = self._entity_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ENTITY_CACHE_TTL:
+            self._entity_cache.move_to_end(key)
+            return cached[1]
+        # Concurrent misses for the same key share one lookup instead of each sending a request
+        lookup = self._resolve_inflight.get(key)
+        if lookup is None:
+            lookup = asyncio.ensure_future(account.get_input_entity(peer))
+            self._resolve_inflight[key] = lookup
+            lookup.add_done_callback(lambda _: self._resolve_inflight.pop(key, None))
+        # Shielded so one cancelled caller doesn't cancel the lookup the others are waiting on
+        entity = await asyncio.shield(lookup)
+        self._entity_cache[key] = (time.monotonic(), entity)
+        self._entity_cache.move_to_end(key)
+        if len(self._entity_cache) > ENTITY_CACHE_SIZE:
+            self._entity_cache.popitem(last=False)
+        return entity
+
+    async def apply_reaction(self, account, chat, message_id, reaction):
         """
         Apply the selected reaction using the given account.
-        """
-        try:
-            await account.send_message(link, reaction)
-            logger.info(f"Applied {reaction} reaction using account {account.session.filename}")
-        except Exception as e:
-            logger.error(f"Error applying reaction: {e}")
+        `chat` is either a channel ID or a username, as returned by _parse_link_sync.
+        """
+        peer = await self._cached_resolve(account, chat) if isinstance(chat, str) else chat
+        await account(SendReactionRequest(
+            peer=peer,
+            msg_id=message_id,
+            reaction=_REACTION_OBJS.get(reaction) or [ReactionEmoji(emoticon=reaction)]
+        ))
+        logger.info(f"Applied {reaction} reaction using account {get_session_name(account)}")
 
     async def poll(self, account, event):
         """
         Perform the poll action.
         """
         # Implement the poll logic here
-        await event.respond(f"Poll action performed by {account.session.filename}")
+        await event.respond(f"Poll action performed by {get_session_name(account)}")
 
     async def join(self, account, event):
         """
         Perform the join action.
         """
         # Implement the join logic here
-        await event.respond(f"Join action performed by {account.session.filename}")
+        await event.respond(f"Join action performed by {get_session_name(account)}")
 
     async def left(self, account, event):
         """
         Perform the left action.
         """
         # Implement the left logic here
-        await event.respond(f"Left action performed by {account.session.filename}")
+        await event.respond(f"Left action performed by {get_session_name(account)}")
 
     async def block(self, account, event):
         """
         Perform the block action.
         """
         # Implement the block logic here
-        await event.respond(f"Block action performed by {account.session.filename}")
+        await event.respond(f"Block action performed by {get_session_name(account)}")
 
     async def send_pv(self, account, event):
         """
         Perform the send_pv action.
         """
         # Implement the send_pv logic here
-        await event.respond(f"Send PV action performed by {account.session.filename}")
+        await event.respond(f"Send PV action performed by {get_session_name(account)}")
 
     async def comment(self, account, event):
         """
         Perform the comment action.
         """
         # Implement the comment logic here
-        await event.respond(f"Comment action performed by {account.session.filename}")
+        await event.respond(f"Comment action performed by {get_session_name(account)}")
 
     async def exit(self, account, event):
         """
         Perform the exit action.
         """
         # Implement the exit logic here
-        await event.respond(f"Exit action performed by {account.session.filename}")
+        await event.respond(f"Exit action performed by {get_session_name(account)}")